@@ -8,10 +8,10 @@ Run:
     python pdf_viewer.py
 
 What changed:
-- Asynchronous thumbnail generation (QThread) with a floating progress dialog: "Generating thumbnails..."
-- Export uses a modal QProgressDialog (blocking) with Cancel option; export loop checks for cancel and aborts cleanly.
+- Thumbnails are rendered on demand in a background QThread, only for the part of the strip that is visible.
+- Export runs in a background QThread behind a modal QProgressDialog with Cancel option; the worker checks for cancel and aborts cleanly.
 - Prompts the user to skip thumbnails automatically if the PDF has many pages.
-- Thumbnails are not all kept in memory permanently; they are created and added to the UI then released.
+- Thumbnail widgets are pooled and reused as the strip scrolls; rendered thumbnails are kept only as PNG bytes.
 
 Usage:
 - Paste links (one per line) in the right dock.
@@ -21,8 +21,11 @@ Usage:
 """
 
 import sys
-import io
 import os
+import queue
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 
 from PyQt5.QtWidgets import (
@@ -41,9 +44,10 @@ from PyQt5.QtWidgets import (
     QTextEdit,
     QMessageBox,
     QProgressDialog,
+    QCheckBox,
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen
-from PyQt5.QtCore import Qt, QRect, QThread, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QPainter, QPen
+from PyQt5.QtCore import Qt, QRect, QObject, QEvent, QThread, QTimer, QBuffer, QIODevice, pyqtSignal
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QTextEdit, QPushButton, QHBoxLayout
 
 import fitz  # PyMuPDF
@@ -54,13 +58,65 @@ import qrcode
 def pixmap_from_fitz_page(page, zoom=1.0):
     mat = fitz.Matrix(zoom, zoom)
     pix = page.get_pixmap(matrix=mat, alpha=False)
-    mode = "RGB"
-    img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    qt_pix = QPixmap()
-    qt_pix.loadFromData(buf.getvalue(), format=b"PNG")
-    return qt_pix
+    # wrap the raw RGB samples directly; copy() detaches from the fitz buffer
+    img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+    return QPixmap.fromImage(img.copy())
+
+# recently rendered (page, zoom) pixmaps kept for page flips, bounded by pixmap memory;
+# one A4 page at 400% is ~31 MB, so only a couple of high-zoom pages fit
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+# thumbnails are rendered straight at low resolution instead of zooming a full render
+MAX_THUMB_DPI = 36
+MAX_THUMB_BYTES = 512 * 1024
+# thumbnail widgets are pooled; this many exist up front and more are added if the strip needs them
+THUMB_POOL_SIZE = 32
+# thumbnails per cross-thread signal when pages are queued faster than they render
+THUMB_BATCH_SIZE = 32
+# Qt maps PNG quality [0, 100] onto zlib level [9, 0]; 89 gives level 1
+THUMB_PNG_QUALITY = 89
+
+def thumb_zoom(page_rect, thumb_max_height):
+    # returned as a zoom factor because get_pixmap(dpi=) only takes ints
+    dpi = min(MAX_THUMB_DPI, 72 * thumb_max_height / page_rect.height) if page_rect.height > 0 else 14
+    return dpi / 72
+
+# garbage-collect duplicate objects and deflate every stream; smaller files, slower save
+COMPACT_SAVE_OPTIONS = dict(
+    garbage=4,
+    deflate=True,
+    deflate_images=True,
+    deflate_fonts=True,
+    clean=True,
+    pretty=False,
+)
+
+# below this many new links the process pool start-up costs more than it saves
+QR_POOL_MIN_LINKS = 32
+
+
+# pixels per QR module, same as qrcode.make's default
+QR_BOX_SIZE = 10
+
+
+def _make_qr_samples(link):
+    # module level so ProcessPoolExecutor can pickle it; returns plain bytes
+    qr = qrcode.QRCode(box_size=1)
+    qr.add_data(link)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()  # includes the quiet-zone border
+    n = len(matrix)
+    # one gray byte per module, then a nearest-neighbour upscale in C
+    # instead of qrcode's per-module rectangle drawing
+    modules = bytes(0 if dark else 255 for row in matrix for dark in row)
+    size = n * QR_BOX_SIZE
+    img = Image.frombytes("L", (n, n), modules).resize((size, size), Image.NEAREST)
+    return size, size, img.tobytes()
+
+def fitz_pixmap_from_qr(link):
+    # hand PyMuPDF raw 8-bit gray samples so no PNG encode/decode is needed
+    w, h, samples = _make_qr_samples(link)
+    return fitz.Pixmap(fitz.csGRAY, w, h, samples, 0)
 
 class FilenamesDialog(QDialog):
     def __init__(self, num_pages, parent=None):
@@ -100,49 +156,191 @@ class FilenamesDialog(QDialog):
 
 
 class ThumbnailWorker(QThread):
-    progress = pyqtSignal(int, int)  # current, total
-    produced = pyqtSignal(int, QPixmap)  # index, pixmap
-    finished_signal = pyqtSignal()
+    produced_batch = pyqtSignal(list)  # [(index, png bytes), ...]
 
     def __init__(self, doc, thumb_max_height=120, parent=None):
         super().__init__(parent)
         self.doc = doc
         self.thumb_max_height = thumb_max_height
+        self.queue = queue.Queue()
+        # pages the viewer currently wants, as (start, stop); replaced whole, so reads are atomic
+        self.window = (0, 0)
         self._running = True
 
+    def request(self, index):
+        self.queue.put(index)
+
+    def set_window(self, start, stop):
+        self.window = (start, stop)
+
     def run(self):
-        total = self.doc.page_count
-        for i in range(total):
-            if not self._running:
+        # pages are rendered in the order the viewer asks for them, until stop();
+        # results go out in batches, flushed when full or when the queue runs dry
+        batch = []
+        # one PNG buffer for the whole run; reserve() keeps its allocation across resize(0)
+        buf = QBuffer()
+        buf.buffer().reserve(64 * 1024)
+        buf.open(QIODevice.ReadWrite)
+        rendered = set()
+        while self._running:
+            if batch:
+                try:
+                    i = self.queue.get_nowait()
+                except queue.Empty:
+                    self.produced_batch.emit(batch)
+                    batch = []
+                    continue
+            else:
+                i = self.queue.get()
+            if i is None or not self._running:
                 break
-            try:
+            start, stop = self.window
+            if i in rendered or not start <= i < stop:
+                continue  # scrolled away before its turn; the viewer requests it again if needed
+            rendered.add(i)
+            batch.append(self._render(i, buf))
+            if len(batch) >= THUMB_BATCH_SIZE:
+                self.produced_batch.emit(batch)
+                batch = []
+        if batch:
+            self.produced_batch.emit(batch)
+
+    def _render(self, i, buf):
+        try:
+            page = self.doc.load_page(i)
+            zoom = thumb_zoom(page.rect, self.thumb_max_height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            # odd page shapes (long strips, posters) can still produce big buffers
+            while pix.stride * pix.height > MAX_THUMB_BYTES and min(pix.width, pix.height) > 1:
+                pix.shrink(1)
+            # QImage is fine off the GUI thread; only PNG bytes leave the worker
+            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+            buf.buffer().resize(0)
+            buf.seek(0)
+            img.save(buf, "PNG", THUMB_PNG_QUALITY)
+            return i, bytes(buf.data())
+        except Exception:
+            return i, b""
+
+    def stop(self):
+        self._running = False
+        self.queue.put(None)  # wake run() if it is waiting for work
+
+
+class ExportWorker(QThread):
+    progress = pyqtSignal(int)  # pages done
+    error = pyqtSignal(str)
+    done = pyqtSignal(str)  # output path
+    cancelled = pyqtSignal()
+    saving = pyqtSignal()  # page loop finished; doc.save cannot be interrupted
+
+    def __init__(self, doc, out_path, selection, links, pixmaps, save_options=None, parent=None):
+        super().__init__(parent)
+        self.doc = doc
+        self.out_path = out_path
+        self.selection = selection
+        self.links = links
+        self.pixmaps = pixmaps
+        self.save_options = save_options or {}
+        self._cancel = False
+
+    def cancel(self):
+        self._cancel = True
+
+    def run(self):
+        try:
+            border_ratio = 0.05
+            # pages with the same link share one embedded image object
+            xref_by_url = {}
+            for i in range(len(self.links)):
+                if self._cancel:
+                    self.cancelled.emit()
+                    return
+
                 page = self.doc.load_page(i)
-                rect = page.rect
-                base_height = rect.height
-                zoom = (self.thumb_max_height / base_height) if base_height > 0 else 0.2
-                thumb_pix = pixmap_from_fitz_page(page, zoom=zoom)
-            except Exception:
-                thumb_pix = QPixmap(80, self.thumb_max_height)
-                thumb_pix.fill(Qt.lightGray)
+                rect = page.rect  # PDF page coordinates
 
-            self.produced.emit(i, thumb_pix)
-            self.progress.emit(i + 1, total)
+                # Use self.selection (normalized 0-1) to map to PDF page coordinates
+                nx, ny, nw, nh = self.selection
+                x0 = rect.x0 + nx * rect.width
+                y0 = rect.y0 + ny * rect.height
+                x1 = x0 + nw * rect.width
+                y1 = y0 + nh * rect.height
 
-        self.finished_signal.emit()
+                # Apply border
+                border_x = (x1 - x0) * border_ratio
+                border_y = (y1 - y0) * border_ratio
+                x0 += border_x
+                y0 += border_y
+                x1 -= border_x
+                y1 -= border_y
 
-    def stop(self):
-        self._running = False
+                self._insert_qr(page, fitz.Rect(x0, y0, x1, y1), i, xref_by_url)
+                self.progress.emit(i + 1)
+
+            if self._cancel:
+                self.cancelled.emit()
+                return
+            self.saving.emit()
+            self.doc.save(self.out_path, **self.save_options)
+            self.done.emit(self.out_path)
+
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            # every exit path releases the copied document and its file handle
+            self.doc.close()
+
+    def _insert_qr(self, page, rect, i, xref_by_url):
+        link = self.links[i]
+        if link in xref_by_url:
+            page.insert_image(rect, xref=xref_by_url[link])
+        else:
+            xref_by_url[link] = page.insert_image(rect, pixmap=self.pixmaps[i])
 
 
 class SelectableLabel(QLabel):
+    selectionFinalized = pyqtSignal(object)  # normalized (x, y, w, h)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._bg = None  # page pixmap, painted directly instead of through QLabel
         self._start = None
         self._end = None
+        self._sel_px = None  # selection in pixmap pixels, kept in sync with self.selection
         self.selection = None
         self._dragging = False
         self._drag_offset = (0, 0)
 
+    @property
+    def selection(self):
+        return self._selection
+
+    @selection.setter
+    def selection(self, value):
+        self._selection = value
+        self._update_sel_px()
+
+    def setPixmap(self, pixmap):
+        super().setPixmap(pixmap)
+        self._bg = pixmap
+        self._update_sel_px()
+        self.update()
+
+    def setText(self, text):
+        super().setText(text)
+        self._bg = None
+        self._update_sel_px()
+
+    def _update_sel_px(self):
+        pm = self._bg
+        if self._selection is None or pm is None or pm.isNull():
+            self._sel_px = None
+            return
+        nx, ny, nw, nh = self._selection
+        pw, ph = pm.width(), pm.height()
+        self._sel_px = QRect(int(nx * pw), int(ny * ph), int(nw * pw), int(nh * ph))
+
     def mousePressEvent(self, event):
         if not self.pixmap():
             return
@@ -150,11 +348,7 @@ class SelectableLabel(QLabel):
             if self.selection and self._point_in_selection(event.pos()):
                 # Start dragging
                 self._dragging = True
-                nx, ny, nw, nh = self.selection
-                pw, ph = self.pixmap().width(), self.pixmap().height()
-                x = int(nx * pw)
-                y = int(ny * ph)
-                self._drag_offset = (event.pos().x() - x, event.pos().y() - y)
+                self._drag_offset = (event.pos().x() - self._sel_px.x(), event.pos().y() - self._sel_px.y())
             else:
                 # Start drawing new rectangle
                 self._start = event.pos()
@@ -164,10 +358,10 @@ class SelectableLabel(QLabel):
 
     def mouseMoveEvent(self, event):
         if self._dragging:
-            # Move the selection
-            nx, ny, nw, nh = self.selection
+            # Move the selection; its pixel size does not change while dragging
+            nx, ny, nw, nh = self._selection
             pw, ph = self.pixmap().width(), self.pixmap().height()
-            w, h = int(nw * pw), int(nh * ph)
+            w, h = self._sel_px.width(), self._sel_px.height()
             new_x = event.pos().x() - self._drag_offset[0]
             new_y = event.pos().y() - self._drag_offset[1]
 
@@ -175,17 +369,25 @@ class SelectableLabel(QLabel):
             new_x = max(0, min(new_x, pw - w))
             new_y = max(0, min(new_y, ph - h))
 
-            self.selection = (new_x / pw, new_y / ph, nw, nh)
-            self.update()
+            old_px = self._sel_px
+            self._selection = (new_x / pw, new_y / ph, nw, nh)
+            self._sel_px = QRect(new_x, new_y, w, h)
+            self._update_region(old_px, self._sel_px)
 
         elif self._start is not None:
+            old_rect = QRect(self._start, self._end).normalized()
             self._end = event.pos()
-            self.update()
+            self._update_region(old_rect, QRect(self._start, self._end).normalized())
+
+    def _update_region(self, old_rect, new_rect):
+        # repaint only where the rectangle was and is now, plus room for the 2px pen
+        self.update(old_rect.united(new_rect).adjusted(-3, -3, 3, 3))
 
     def mouseReleaseEvent(self, event):
         if self._dragging:
             self._dragging = False
             self.update()
+            self.selectionFinalized.emit(self.selection)
         elif self._start is not None:
             self._end = event.pos()
             self._finalize_selection()
@@ -194,15 +396,11 @@ class SelectableLabel(QLabel):
             self.update()
 
     def _point_in_selection(self, point):
-        if self.selection is None:
+        r = self._sel_px
+        if r is None:
             return False
-        nx, ny, nw, nh = self.selection
-        pw, ph = self.pixmap().width(), self.pixmap().height()
-        x = int(nx * pw)
-        y = int(ny * ph)
-        w = int(nw * pw)
-        h = int(nh * ph)
-        return x <= point.x() <= x + w and y <= point.y() <= y + h
+        # edges inclusive on both sides, unlike QRect.contains
+        return r.x() <= point.x() <= r.x() + r.width() and r.y() <= point.y() <= r.y() + r.height()
 
     def _finalize_selection(self):
         if self._start is None or self._end is None or not self.pixmap():
@@ -222,14 +420,17 @@ class SelectableLabel(QLabel):
             return
 
         self.selection = (x1 / pw, y1 / ph, size / pw, size / ph)
+        self.selectionFinalized.emit(self.selection)
     
     def paintEvent(self, event):
-        super().paintEvent(event)
-
-        if not self.pixmap():
+        if self._bg is None:
+            super().paintEvent(event)  # text such as "No document loaded"
             return
 
         painter = QPainter(self)
+        # the label is sized to the pixmap, so only the dirty part needs copying
+        dirty = event.rect()
+        painter.drawPixmap(dirty, self._bg, dirty)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw currently drawn rectangle
@@ -242,20 +443,69 @@ class SelectableLabel(QLabel):
             painter.drawRect(rect.normalized())
 
         # Draw finalized selection
-        if self.selection:
-            nx, ny, nw, nh = self.selection
-            pw, ph = self.pixmap().width(), self.pixmap().height()
-            x = int(nx * pw)
-            y = int(ny * ph)
-            w = int(nw * pw)
-            h = int(nh * ph)
+        if self._sel_px is not None:
             pen = QPen(Qt.green, 2, Qt.SolidLine)
             painter.setPen(pen)
             painter.setBrush(Qt.transparent)
-            painter.drawRect(x, y, w, h)
+            painter.drawRect(self._sel_px)
 
 
 
+class ThumbnailLabel(QLabel):
+    """Pooled thumbnail that keeps only PNG bytes and decodes them when it is painted."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index = -1
+        self.cache = {}
+        self._key = None
+
+    def set_page(self, index, cache, generation):
+        self.index = index
+        self.cache = cache
+        self.setProperty("pageIndex", index)
+        self.setToolTip(f"Page {index + 1}")
+        # QPixmapCache is global, so keys carry the document generation
+        self._key = f"qrdoc-thumb-{generation}-{index}"
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        data = self.cache.get(self.index)
+        if data is None:
+            return  # not rendered yet
+
+        painter = QPainter(self)
+        if not data:
+            # render failed in the worker
+            painter.fillRect(self.rect(), Qt.lightGray)
+            return
+
+        pix = QPixmapCache.find(self._key)
+        if pix is None:
+            pix = QPixmap()
+            pix.loadFromData(data, "PNG")
+            QPixmapCache.insert(self._key, pix)
+        # slots are sized from page 0, so shrink pages that are wider or taller than that
+        scale = min(1.0, self.width() / pix.width(), self.height() / pix.height())
+        w, h = int(pix.width() * scale), int(pix.height() * scale)
+        painter.drawPixmap(QRect((self.width() - w) // 2, (self.height() - h) // 2, w, h), pix)
+
+
+class ThumbnailClickFilter(QObject):
+    """One event filter shared by every pooled thumbnail; reads the page from the widget."""
+
+    clicked = pyqtSignal(int)  # page index
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress:
+            index = obj.property("pageIndex")
+            if index is not None and index >= 0:
+                self.clicked.emit(index)
+                return True
+        return False
+
+
 class PDFViewer(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -265,6 +515,15 @@ class PDFViewer(QMainWindow):
         self.doc = None
         self.current_page_index = 0
         self.zoom = 1.0
+        self._render_cache = OrderedDict()  # (page index, zoom) -> QPixmap, least recent first
+        self._render_cache_bytes = 0
+
+        # slider drags fire many valueChanged signals; only the last one within 50 ms renders
+        self._pending_zoom = self.zoom
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -309,6 +568,7 @@ class PDFViewer(QMainWindow):
         self.page_label = SelectableLabel()
         self.page_label.setAlignment(Qt.AlignCenter)
         self.page_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.page_label.selectionFinalized.connect(self._on_selection_ready)
 
         page_container = QWidget()
         page_layout = QVBoxLayout(page_container)
@@ -318,15 +578,17 @@ class PDFViewer(QMainWindow):
         left_v.addWidget(self.page_scroll, stretch=1)
 
         # Thumbnail strip with placeholder
+        # no layout: pooled thumbnail frames are positioned by page index
         self.thumbs_container = QWidget()
-        self.thumbs_hbox = QHBoxLayout(self.thumbs_container)
-        self.thumbs_hbox.setContentsMargins(5, 5, 5, 5)
-        self.thumbs_hbox.setSpacing(5)
+        self.thumb_margin = 5
+        self.thumb_spacing = 5
 
         self.thumbs_scroll = QScrollArea()
-        self.thumbs_scroll.setWidgetResizable(True)
+        self.thumbs_scroll.setWidgetResizable(False)
         self.thumbs_scroll.setFixedHeight(140)
         self.thumbs_scroll.setWidget(self.thumbs_container)
+        self.thumbs_scroll.horizontalScrollBar().valueChanged.connect(self.request_visible_thumbs)
+        self.thumbs_scroll.horizontalScrollBar().rangeChanged.connect(self.request_visible_thumbs)
 
         left_v.addWidget(self.thumbs_scroll)
 
@@ -356,15 +618,34 @@ class PDFViewer(QMainWindow):
         self.btn_export_individual.setEnabled(False)
         dock_v.addWidget(self.btn_export_individual)
 
+        self.chk_compact = QCheckBox("Compact output (smaller file, slower save)")
+        self.chk_compact.setChecked(True)
+        dock_v.addWidget(self.chk_compact)
+
         dock_v.addStretch()
 
         main_h.addWidget(dock, stretch=1)
 
         # state
         self.selection = None
-        self.qr_images = []
+        self.qr_links = []
+        self.qr_pixmaps = []
+        self.qr_cache = {}
         self.thumb_worker = None
-        self.thumb_dialog = None
+        self.export_worker = None
+        self.thumb_dirty = set()  # pages whose thumbnail has not been requested yet
+        self.thumb_cache = {}  # page index -> png bytes
+        self.thumb_generation = 0
+        self.thumb_count = 0
+        self.thumb_slot_size = (0, 0)
+        self.thumb_pitch = 1
+
+        self._thumb_event_filter = ThumbnailClickFilter(self)
+        self._thumb_event_filter.clicked.connect(self.on_thumb_click)
+        self._thumb_free = []  # pooled (frame, label) pairs not showing a page
+        self._thumb_used = {}  # page index -> (frame, label)
+        for _ in range(THUMB_POOL_SIZE):
+            self._thumb_free.append(self._new_thumb_slot())
 
     # ---------------------- PDF Loading & Rendering ----------------------
     def open_pdf(self):
@@ -379,8 +660,12 @@ class PDFViewer(QMainWindow):
 
         self.current_page_index = 0
         self.zoom = self.zoom_slider.value() / 100.0
+        self._render_cache.clear()
+        self._render_cache_bytes = 0
         self.selection = None
-        self.qr_images = []
+        self.qr_links = []
+        self.qr_pixmaps = []
+        self.qr_cache = {}
         self.btn_export.setEnabled(False)
         self.render_current_page()
 
@@ -395,82 +680,149 @@ class PDFViewer(QMainWindow):
                 QMessageBox.Yes,
             )
             if resp == QMessageBox.Yes:
-                # clear existing thumbs
-                for i in reversed(range(self.thumbs_hbox.count())):
-                    w = self.thumbs_hbox.itemAt(i).widget()
-                    if w:
-                        w.setParent(None)
+                self.clear_thumbnails()
                 return
 
-        # otherwise, generate thumbnails asynchronously with floating dialog
+        # otherwise, render thumbnails in the background as they scroll into view
         self.start_thumbnail_worker()
 
     def render_current_page(self):
         if not self.doc:
             self.page_label.setText("No document loaded")
             return
-        page = self.doc.load_page(self.current_page_index)
-        pix = pixmap_from_fitz_page(page, zoom=self.zoom)
+        key = (self.current_page_index, round(self.zoom, 2))
+        pix = self._render_cache.get(key)
+        if pix is None:
+            page = self.doc.load_page(self.current_page_index)
+            pix = pixmap_from_fitz_page(page, zoom=self.zoom)
+            self._cache_render(key, pix)
+        else:
+            self._render_cache.move_to_end(key)
         self.page_label.setPixmap(pix)
         self.page_label.resize(pix.width(), pix.height())
         if self.page_label.selection != self.selection:
             self.page_label.selection = self.selection
             self.page_label.update()
 
-    def start_thumbnail_worker(self):
-        # clear existing
-        for i in reversed(range(self.thumbs_hbox.count())):
-            w = self.thumbs_hbox.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-
-        self.thumb_dialog = QProgressDialog("Generating thumbnails...", "Cancel", 0, self.doc.page_count, self)
-        # non-modal floating dialog
-        self.thumb_dialog.setWindowModality(Qt.NonModal)
-        self.thumb_dialog.setWindowTitle("Generating thumbnails")
-        self.thumb_dialog.show()
-
-        self.thumb_worker = ThumbnailWorker(self.doc, thumb_max_height=120)
-        self.thumb_worker.produced.connect(self.on_thumb_produced)
-        self.thumb_worker.progress.connect(self.on_thumb_progress)
-        self.thumb_worker.finished_signal.connect(self.on_thumb_finished)
-        self.thumb_worker.start()
-
-    def on_thumb_produced(self, index, pix):
-        # Build thumbnail widget quickly and release pixmap reference if needed
-        lbl = QLabel()
-        lbl.setPixmap(pix)
-        lbl.setToolTip(f"Page {index + 1}")
-        lbl.mousePressEvent = partial(self.on_thumb_click, index=index)
-
-        container = QFrame()
+    def _cache_render(self, key, pix):
+        size = pix.width() * pix.height() * pix.depth() // 8
+        if size > RENDER_CACHE_BYTES:
+            return  # the label already holds it; caching would only evict everything else
+        self._render_cache[key] = pix
+        self._render_cache_bytes += size
+        while self._render_cache_bytes > RENDER_CACHE_BYTES:
+            _, old = self._render_cache.popitem(last=False)
+            self._render_cache_bytes -= old.width() * old.height() * old.depth() // 8
+
+    def _new_thumb_slot(self):
+        lbl = ThumbnailLabel()
+        lbl.setAlignment(Qt.AlignCenter)
+        lbl.installEventFilter(self._thumb_event_filter)
+
+        container = QFrame(self.thumbs_container)
         container.setFrameShape(QFrame.StyledPanel)
         c_layout = QVBoxLayout(container)
         c_layout.setContentsMargins(2, 2, 2, 2)
         c_layout.addWidget(lbl)
-        self.thumbs_hbox.addWidget(container)
+        container.hide()
+        return container, lbl
+
+    def clear_thumbnails(self):
+        if self.thumb_worker:
+            self.thumb_worker.stop()
+            self.thumb_worker.wait()
+            self.thumb_worker = None
+        for container, lbl in self._thumb_used.values():
+            container.hide()
+            lbl.setProperty("pageIndex", -1)
+            self._thumb_free.append((container, lbl))
+        self._thumb_used = {}
+        self.thumb_count = 0
+        self.thumbs_container.resize(0, 0)
+        self.thumb_dirty = set()
+        self.thumb_cache = {}
+        self.thumb_generation += 1
 
-        # allow Qt to free the pix variable when out of scope
-
-    def on_thumb_progress(self, current, total):
-        if self.thumb_dialog:
-            self.thumb_dialog.setValue(current)
-            if self.thumb_dialog.wasCanceled():
-                if self.thumb_worker:
-                    self.thumb_worker.stop()
+    def start_thumbnail_worker(self):
+        self.clear_thumbnails()
+
+        # every slot is sized like page 0 so the strip width is known before anything is rendered
+        thumb_max_height = 120
+        rect = self.doc.load_page(0).rect
+        zoom = thumb_zoom(rect, thumb_max_height)
+        irect = (rect * fitz.Matrix(zoom, zoom)).irect  # same rounding get_pixmap uses
+        thumb_w, thumb_h = max(1, irect.width), max(1, irect.height)
+
+        frame = self._thumb_free[0][0] if self._thumb_free else self._new_thumb_slot()[0]
+        # label size plus the frame's layout margins and border
+        extra = frame.layout().contentsMargins().left() * 2 + frame.frameWidth() * 2
+        self.thumb_slot_size = (thumb_w + extra, thumb_h + extra)
+        self.thumb_pitch = self.thumb_slot_size[0] + self.thumb_spacing
+        self.thumb_count = self.doc.page_count
+        self.thumbs_container.resize(
+            self.thumb_margin * 2 + self.thumb_count * self.thumb_pitch - self.thumb_spacing,
+            self.thumb_margin * 2 + self.thumb_slot_size[1],
+        )
+        self.thumb_dirty = set(range(self.thumb_count))
+
+        self.thumb_worker = ThumbnailWorker(self.doc, thumb_max_height=thumb_max_height)
+        self.thumb_worker.produced_batch.connect(self.on_thumb_batch)
+        self.thumb_worker.start()
+        self.request_visible_thumbs()
 
-    def on_thumb_finished(self):
-        if self.thumb_dialog:
-            self.thumb_dialog.close()
-            self.thumb_dialog = None
-        self.thumb_worker = None
-        self.thumbs_hbox.addStretch()
+    def request_visible_thumbs(self, *args):
+        if not self.thumb_count or not self.thumb_worker:
+            return
+        left = self.thumbs_scroll.horizontalScrollBar().value() - self.thumb_margin
+        right = left + self.thumbs_scroll.viewport().width()
+        # one viewport-width of look-ahead on each side so short scrolls are already rendered
+        span = right - left
+        start = max(0, (left - span) // self.thumb_pitch)
+        stop = min(self.thumb_count, (right + span) // self.thumb_pitch + 1)
+        self.thumb_worker.set_window(start, stop)
+
+        # hand slots of pages that left the window back to the pool, then fill the window;
+        # pages not rendered yet become dirty again since the worker will skip them
+        for index in [i for i in self._thumb_used if not start <= i < stop]:
+            container, lbl = self._thumb_used.pop(index)
+            container.hide()
+            self._thumb_free.append((container, lbl))
+            if index not in self.thumb_cache:
+                self.thumb_dirty.add(index)
+        for index in range(start, stop):
+            if index not in self._thumb_used:
+                container, lbl = self._thumb_free.pop() if self._thumb_free else self._new_thumb_slot()
+                lbl.set_page(index, self.thumb_cache, self.thumb_generation)
+                container.setGeometry(
+                    self.thumb_margin + index * self.thumb_pitch, self.thumb_margin, *self.thumb_slot_size
+                )
+                container.show()
+                self._thumb_used[index] = (container, lbl)
+            if index in self.thumb_dirty:
+                self.thumb_dirty.discard(index)
+                self.thumb_worker.request(index)
+
+    def on_thumb_batch(self, batch):
+        if self.sender() is not self.thumb_worker:
+            return  # queued result from the worker of a previous document
+        # labels decode these bytes themselves the next time they paint
+        self.thumb_cache.update(batch)
+        for index, _ in batch:
+            if index in self._thumb_used:
+                self._thumb_used[index][1].update()
+
+    def closeEvent(self, event):
+        self.clear_thumbnails()
+        if self.export_worker:
+            self.export_worker.cancel()
+            self.export_worker.wait()
+        super().closeEvent(event)
 
     def build_thumbnails(self):
         # kept for API compatibility; use start_thumbnail_worker instead
         self.start_thumbnail_worker()
 
-    def on_thumb_click(self, event, index):
+    def on_thumb_click(self, index):
         self.current_page_index = index
         self.render_current_page()
 
@@ -498,7 +850,11 @@ class PDFViewer(QMainWindow):
         self.zoom_slider.setValue(val)
 
     def zoom_slider_changed(self, value):
-        self.zoom = value / 100.0
+        self._pending_zoom = value / 100.0
+        self._zoom_timer.start()
+
+    def _apply_pending_zoom(self):
+        self.zoom = self._pending_zoom
         self.render_current_page()
 
     # ---------------------- Bulk QR Creation Flow ----------------------
@@ -528,40 +884,69 @@ class PDFViewer(QMainWindow):
                 return
 
         count = min(num_links, num_pages)
-        self.qr_images = []
-        for i in range(count):
-            qr = qrcode.make(links[i])
-            if qr.mode != 'RGB':
-                qr = qr.convert('RGB')
-            self.qr_images.append(qr)
+        # one pixmap per unique link, built here so both export paths only dispatch
+        self.qr_cache = {}
+        self.build_qr_cache(links[:count])
+        self.qr_links = links[:count]
+        self.qr_pixmaps = [self.qr_cache[link] for link in self.qr_links]
 
         QMessageBox.information(self, "Place QR", "Now drag a rectangle on the PDF page to choose where QR codes should be placed on each page.")
 
         self.selection = None
         self.page_label.selection = None
         self.page_label.update()
+        # export is enabled from _on_selection_ready once the rectangle is drawn
+
+    def _on_selection_ready(self, selection):
+        if not self.qr_pixmaps:
+            return  # not placing QR codes right now
+        self.selection = selection
+        self.btn_export.setEnabled(True)
+        self.btn_export_individual.setEnabled(True)
+
+    def build_qr_cache(self, links):
+        missing = [link for link in dict.fromkeys(links) if link not in self.qr_cache]
+        if len(missing) < QR_POOL_MIN_LINKS:
+            for link in missing:
+                self.qr_pixmap_for(link)
+            return
 
-        # watch selection and enable export when set
-        from PyQt5.QtCore import QTimer
-
-        def check_selection():
-            if self.page_label.selection is not None:
-                self.selection = self.page_label.selection
-                self.btn_export.setEnabled(True)
-                self.btn_export_individual.setEnabled(True)
-                timer.stop()
+        pdlg = QProgressDialog("Generating QR codes...", None, 0, len(missing), self)
+        pdlg.setWindowModality(Qt.ApplicationModal)
+        pdlg.setWindowTitle("Generating QR codes")
+        pdlg.setMinimumDuration(0)
+        pdlg.show()
+        QApplication.processEvents()
 
-        timer = QTimer(self)
-        timer.setInterval(300)
-        timer.timeout.connect(check_selection)
-        timer.start()
+        # each link is independent, so spread the qrcode/PIL work across cores
+        chunksize = max(1, len(missing) // (4 * (os.cpu_count() or 1)))
+        # never fork the Qt GUI process: workers start fresh and only import this module
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        try:
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context(method)) as ex:
+                results = ex.map(_make_qr_samples, missing, chunksize=chunksize)
+                for n, (link, (w, h, samples)) in enumerate(zip(missing, results), start=1):
+                    self.qr_cache[link] = fitz.Pixmap(fitz.csGRAY, w, h, samples, 0)
+                    pdlg.setValue(n)
+                    QApplication.processEvents()
+        finally:
+            pdlg.close()
+
+    def qr_pixmap_for(self, link):
+        pm = self.qr_cache.get(link)
+        if pm is None:
+            pm = self.qr_cache[link] = fitz_pixmap_from_qr(link)
+        return pm
+
+    def save_options(self):
+        return COMPACT_SAVE_OPTIONS if self.chk_compact.isChecked() else {}
 
     # ---------------------- Export (write PDF with embedded QRs) ----------------------
     def export_pdf(self):
         if not self.doc:
             QMessageBox.warning(self, "No PDF", "Please open a PDF first.")
             return
-        if not self.qr_images or not self.selection:
+        if not self.qr_pixmaps or not self.selection:
             QMessageBox.warning(self, "Incomplete", "Please run Bulk QR Code Create and draw a rectangle on the page first.")
             return
 
@@ -569,75 +954,85 @@ class PDFViewer(QMainWindow):
         if not out_path:
             return
 
-        # create a copy of the original by reopening the file path if available; otherwise copy pages
+        # create a copy of the original: reopening the file path is cheapest;
+        # otherwise copy all pages with a single insert_pdf call
         doc = None
-        if hasattr(self.doc, 'name') and getattr(self.doc, 'name'):
+        if getattr(self.doc, 'name', None):
             try:
                 doc = fitz.open(self.doc.name)
             except Exception:
-                doc = fitz.open()
-                for p in self.doc:
-                    doc.insert_pdf(self.doc, from_page=p.number, to_page=p.number)
-        else:
+                doc = None
+        if doc is None:
             doc = fitz.open()
-            for p in self.doc:
-                doc.insert_pdf(self.doc, from_page=p.number, to_page=p.number)
+            doc.insert_pdf(self.doc)
 
-        count = min(len(self.qr_images), self.doc.page_count)
+        count = min(len(self.qr_pixmaps), self.doc.page_count)
 
-        # Modal progress dialog with immediate show and update
-        pdlg = QProgressDialog("Embedding QR codes...", "Cancel", 0, count, self)
+        # Modal progress dialog with immediate show and update; the extra step covers doc.save
+        pdlg = QProgressDialog("Embedding QR codes...", "Cancel", 0, count + 1, self)
         pdlg.setWindowModality(Qt.ApplicationModal)
         pdlg.setWindowTitle("Exporting PDF")
         pdlg.setMinimumDuration(0)  # ensures dialog shows immediately
-        pdlg.show()
-        QApplication.processEvents()  # force repaint so dialog appears
-
-        try:
-            border_ratio = 0.05
-            for i in range(count):
-                if pdlg.wasCanceled():
-                    QMessageBox.information(self, "Cancelled", "Export cancelled by user.")
-                    return
-
-                page = doc.load_page(i)
-                rect = page.rect  # PDF page coordinates
-
-                # Use self.selection (normalized 0-1) to map to PDF page coordinates
-                nx, ny, nw, nh = self.selection  # <-- must be here, inside the loop
-                x0 = rect.x0 + nx * rect.width
-                y0 = rect.y0 + ny * rect.height
-                x1 = x0 + nw * rect.width
-                y1 = y0 + nh * rect.height
-
-                # Apply border
-                border_x = (x1 - x0) * border_ratio
-                border_y = (y1 - y0) * border_ratio
-                x0 += border_x
-                y0 += border_y
-                x1 -= border_x
-                y1 -= border_y
-
-                qr_img = self.qr_images[i]
-                buf = io.BytesIO()
-                qr_img.save(buf, format="PNG")
-                img_bytes = buf.getvalue()
-
-                page.insert_image(fitz.Rect(x0, y0, x1, y1), stream=img_bytes)
 
-                pdlg.setValue(i + 1)
+        # the page loop and save run off the GUI thread; the dialog only reflects progress
+        worker = ExportWorker(
+            doc, out_path, self.selection, self.qr_links[:count], self.qr_pixmaps[:count], self.save_options(),
+            parent=self,
+        )
+        worker.progress.connect(partial(self.on_export_progress, pdlg))
+        worker.saving.connect(partial(self.on_export_saving, pdlg))
+        worker.done.connect(partial(self.on_export_done, pdlg))
+        worker.error.connect(partial(self.on_export_error, pdlg))
+        worker.cancelled.connect(partial(self.on_export_cancelled, pdlg))
+        pdlg.canceled.connect(worker.cancel)
+        # result signals arrive before run() returns; keep the thread alive until it has
+        worker.finished.connect(self._on_export_finished)
+        worker.finished.connect(pdlg.deleteLater)
+        self.export_worker = worker
+        # one export at a time; re-enabled once the thread has finished
+        self.btn_export.setEnabled(False)
+        self.btn_export_individual.setEnabled(False)
+        pdlg.show()
+        worker.start()
+
+    def _on_export_finished(self):
+        worker = self.sender()
+        if worker is self.export_worker:
+            self.export_worker = None
+            self.btn_export.setEnabled(bool(self.qr_pixmaps and self.selection))
+            self.btn_export_individual.setEnabled(bool(self.selection))
+        worker.deleteLater()
+
+    def on_export_progress(self, pdlg, value):
+        # Cancel resets the dialog; progress still queued from the worker would re-show it
+        if not pdlg.wasCanceled():
+            pdlg.setValue(value)
+
+    def on_export_saving(self, pdlg):
+        # Cancel can no longer stop the export, so don't offer it
+        pdlg.canceled.disconnect()
+        pdlg.setCancelButton(None)
+        pdlg.setLabelText("Saving PDF...")
+
+    def on_export_done(self, pdlg, out_path):
+        pdlg.hide()
+        QMessageBox.information(self, "Saved", f"Saved new PDF with QR codes to:\n{out_path}")
 
-            doc.save(out_path)
-            QMessageBox.information(self, "Saved", f"Saved new PDF with QR codes to:\n{out_path}")
+        self.selection = None
+        self.page_label.selection = None
+        self.qr_links = []
+        self.qr_pixmaps = []
+        self.qr_cache = {}
+        self.page_label.update()
+        self.btn_export.setEnabled(False)
 
-            self.selection = None
-            self.page_label.selection = None
-            self.qr_images = []
-            self.page_label.update()
-            self.btn_export.setEnabled(False)
+    def on_export_error(self, pdlg, message):
+        pdlg.hide()
+        QMessageBox.critical(self, "Export failed", f"Failed during export:\n{message}")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Export failed", f"Failed during export:\n{e}")
+    def on_export_cancelled(self, pdlg):
+        pdlg.hide()
+        QMessageBox.information(self, "Cancelled", "Export cancelled by user.")
 
     # ---------------------- Export Individually ----------------------
     def export_individual_pdfs(self):
@@ -692,9 +1087,7 @@ class PDFViewer(QMainWindow):
 
                 # Add QR code if available
                 if i < len(links):
-                    qr = qrcode.make(links[i])
-                    if qr.mode != "RGB":
-                        qr = qr.convert("RGB")
+                    pm = self.qr_pixmap_for(links[i])
 
                     nx, ny, nw, nh = self.selection
                     page = new_doc.load_page(0)
@@ -716,13 +1109,10 @@ class PDFViewer(QMainWindow):
                     x1 -= border_x
                     y1 -= border_y
 
-                    buf = io.BytesIO()
-                    qr.save(buf, format="PNG")
-                    img_bytes = buf.getvalue()
-                    page.insert_image(fitz.Rect(x0, y0, x1, y1), stream=img_bytes)
+                    page.insert_image(fitz.Rect(x0, y0, x1, y1), pixmap=pm)
 
                 # Save the individual PDF
-                new_doc.save(out_path)
+                new_doc.save(out_path, **self.save_options())
                 new_doc.close()
 
                 pdlg.setValue(i + 1)
@@ -731,7 +1121,9 @@ class PDFViewer(QMainWindow):
 
             self.selection = None
             self.page_label.selection = None
-            self.qr_images = []
+            self.qr_links = []
+            self.qr_pixmaps = []
+            self.qr_cache = {}
             self.page_label.update()
             self.btn_export.setEnabled(False)
 
@@ -739,6 +1131,7 @@ class PDFViewer(QMainWindow):
             QMessageBox.critical(self, "Export failed", f"Failed during export:\n{e}")
 
 def main():
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     viewer = PDFViewer()
     viewer.show()